@@ -10,18 +10,138 @@ Each procedural generator conforms to IAssetGenerator:
     description: str
     parameters: Dict[str, Any]
     generate(**kwargs) -> object (Ursina Texture/Mesh/etc.)
+
+Texture generators may return a PixelBuffer instead; it is uploaded to an
+engine texture here and only the texture is cached.
 """
 from typing import Dict, Callable, Any, Type
-from ursina import Texture
-from PIL import Image
 import inspect
+from frontend.pixel_buffer import PixelBuffer
 
 
 # ==========================================
 # frontend/asset_manager.py (interface base)
 # ==========================================
-from typing import Dict, Any
+from typing import Dict, Any, Mapping, Tuple
+from collections.abc import Mapping as MappingABC
 import random, hashlib, json
+import importlib, pathlib, pkgutil
+from types import MappingProxyType
+
+
+def _deep_freeze(v):
+    """Lists/tuples -> tuples, dicts -> read-only mappings, recursively."""
+    if isinstance(v, (list, tuple)):
+        return tuple(_deep_freeze(x) for x in v)
+    if isinstance(v, dict):
+        return MappingProxyType({k: _deep_freeze(x) for k, x in v.items()})
+    return v
+
+
+def _memo_key(v):
+    """Hashable, type-sensitive key: 1, 1.0 and True stay apart at any depth."""
+    if isinstance(v, (list, tuple)):
+        return (type(v), tuple(_memo_key(x) for x in v))
+    if isinstance(v, Mapping):
+        return (dict, tuple((k, _memo_key(x)) for k, x in v.items()))
+    return (type(v), v)
+
+
+class FrozenConfig(MappingABC):
+    """
+    Immutable, validated generator config.
+
+    The stable digest (sha256 of the sorted JSON) and the cache key
+    '<generator id>:<digest>' are computed once, so the same object can be
+    used for cache lookup, RNG seeding and disk keys without re-hashing.
+    Container values are frozen too (lists become tuples, dicts read-only
+    mappings), so nothing can drift from the precomputed digest.
+    """
+    __slots__ = ("generator_id", "digest", "key", "_values", "_hash")
+
+    def __init__(self, generator_id: str, values: Dict[str, Any]):
+        self.generator_id = generator_id
+        # digest the plain values; the frozen copy hashes to the same JSON
+        self.digest = hashlib.sha256(
+            json.dumps(values, sort_keys=True).encode()).hexdigest()
+        self._values = {k: _deep_freeze(v) for k, v in values.items()}
+        self.key = f"{generator_id}:{self.digest}"
+        self._hash = hash(self.key)
+
+    def __getitem__(self, name):
+        return self._values[name]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenConfig):
+            return self.key == other.key and self._values == other._values
+        return NotImplemented
+
+    def __repr__(self):
+        return f"FrozenConfig({self.generator_id!r}, {self._values!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain, mutable copy (tuples back to lists, mappings to dicts)."""
+        def thaw(v):
+            if isinstance(v, tuple):
+                return [thaw(x) for x in v]
+            if isinstance(v, MappingProxyType):
+                return {k: thaw(x) for k, x in v.items()}
+            return v
+        return {k: thaw(v) for k, v in self._values.items()}
+
+
+def compile_parameters(parameters: Dict[str, Dict[str, Any]]):
+    """
+    Turn a 'parameters' spec into a validator: cfg -> fixed dict.
+
+    Spec lookups happen once here; the returned function only runs one
+    pre-built coercion per parameter.
+    """
+    def clamp(conv, spec):
+        lo, hi = spec.get("min"), spec.get("max")
+        if lo is None and hi is None:
+            return conv
+        if hi is None:
+            return lambda v: max(lo, conv(v))
+        if lo is None:
+            return lambda v: min(hi, conv(v))
+        return lambda v: min(hi, max(lo, conv(v)))
+
+    fields = []
+    for name, spec in parameters.items():
+        default = spec.get("default")
+        t = spec.get("type")
+        if t == "int":
+            coerce = clamp(int, spec)
+        elif t == "float":
+            coerce = clamp(float, spec)
+        elif t == "enum":
+            values = tuple(spec.get("values", []))
+            coerce = (lambda allowed, d: lambda v: v if v in allowed else d)(values, default)
+        elif t == "bool":
+            coerce = bool
+        else:
+            coerce = None
+        fields.append((name, default, coerce))
+
+    def validate(cfg: Mapping[str, Any]) -> Dict[str, Any]:
+        fixed = {}
+        get = cfg.get
+        for name, default, coerce in fields:
+            v = get(name, default)
+            fixed[name] = coerce(v) if coerce else v
+        return fixed
+
+    return validate
 
 
 class IAssetGeneratorV2:
@@ -43,39 +163,43 @@ class IAssetGeneratorV2:
         tmpl["config"] = cfg
         return tmpl
 
-    def validate(self, cfg: Dict[str, Any]) -> Dict[str, Any]:
-        fixed = {}
-        for name, spec in self.parameters.items():
-            v = cfg.get(name, spec.get("default"))
-            t = spec.get("type")
-            if t == "int":
-                v = int(v)
-                if "min" in spec: v = max(spec["min"], v)
-                if "max" in spec: v = min(spec["max"], v)
-            elif t == "float":
-                v = float(v)
-                if "min" in spec: v = max(spec["min"], v)
-                if "max" in spec: v = min(spec["max"], v)
-            elif t == "enum":
-                if v not in spec.get("values", []):
-                    v = spec.get("default")
-            elif t == "bool":
-                v = bool(v)
-            fixed[name] = v
-        return fixed
+    @classmethod
+    def _validator(cls):
+        # compiled once per generator class, not inherited from a base class
+        compiled = cls.__dict__.get("_compiled_validator")
+        if compiled is None:
+            compiled = compile_parameters(cls.parameters)
+            cls._compiled_validator = compiled
+        return compiled
+
+    def validate(self, cfg: Mapping[str, Any]) -> FrozenConfig:
+        """Return a FrozenConfig; already-frozen configs pass straight through."""
+        if isinstance(cfg, FrozenConfig) and cfg.generator_id == self.id:
+            return cfg
+        return FrozenConfig(self.id, self._validator()(cfg))
 
-    def rng(self, cfg: Dict[str, Any]) -> random.Random:
+    def rng(self, cfg: Mapping[str, Any]) -> random.Random:
         """Return deterministic RNG based on config hash."""
-        h = hashlib.sha256(json.dumps(cfg, sort_keys=True).encode()).hexdigest()
+        if isinstance(cfg, FrozenConfig):
+            h = cfg.digest
+        else:
+            h = hashlib.sha256(json.dumps(cfg, sort_keys=True).encode()).hexdigest()
         return random.Random(int(h[:8], 16))
 
     def generate(self, cfg: Dict[str, Any]):
         raise NotImplementedError
 
 
+# generators still refer to the v1 name in annotations and docs
+IAssetGenerator = IAssetGeneratorV2
+
+
 class AssetManager:
     _registry: Dict[str, Type[IAssetGenerator]] = {}
     _cache: Dict[str, object] = {}
+    _instances: Dict[str, IAssetGeneratorV2] = {}
+    _frozen: Dict[Tuple[str, tuple], FrozenConfig] = {}
+    _frozen_limit = 4096
 
     # ------------------------------------------------------------------
     # Generator registration & discovery
@@ -85,6 +209,8 @@ class AssetManager:
         if not hasattr(generator_cls, "id"):
             raise ValueError("Generator class must define an 'id' attribute")
         cls._registry[generator_cls.id] = generator_cls
+        cls._instances.pop(generator_cls.id, None)
+        cls._frozen = {k: v for k, v in cls._frozen.items() if k[0] != generator_cls.id}
         print(f"[AssetManager] Registered generator '{generator_cls.id}'")
 
     @classmethod
@@ -116,19 +242,65 @@ class AssetManager:
     def get_generator(cls, id_: str):
         return cls._registry.get(id_)
 
-@classmethod
-def generate(cls, id_: str, config: dict = None):
-    gen_cls = cls.get_generator(id_)
-    if not gen_cls:
-        raise KeyError(f"No generator '{id_}' registered")
-    gen = gen_cls()
-    config = config or {k: v["default"] for k, v in gen.parameters.items()}
-    config = gen.validate(config)
-    import json, hashlib
-    cache_key = f"{id_}:{hashlib.md5(json.dumps(config, sort_keys=True).encode()).hexdigest()}"
-    if cache_key in cls._cache:
-        return cls._cache[cache_key]
-    result = gen.generate(config)
-    cls._cache[cache_key] = result
-    return result
+    @classmethod
+    def _instance(cls, id_: str) -> IAssetGeneratorV2:
+        gen = cls._instances.get(id_)
+        if gen is None:
+            gen_cls = cls.get_generator(id_)
+            if not gen_cls:
+                raise KeyError(f"No generator '{id_}' registered")
+            gen = cls._instances[id_] = gen_cls()
+        return gen
 
+    @classmethod
+    def freeze(cls, id_: str, config: Mapping[str, Any] = None) -> FrozenConfig:
+        """
+        Validate a raw config once and return the reusable FrozenConfig.
+
+        Repeated calls with an equal raw dict are memoised, so hot callers
+        pay a key build and a dict lookup instead of validate + hash. Ids
+        without a registered generator are frozen as given, unvalidated.
+        """
+        if isinstance(config, FrozenConfig):
+            if config.generator_id == id_:
+                return config
+            config = config.to_dict()
+        config = config or {}
+        try:
+            memo_key = (id_, _memo_key(config))
+            frozen = cls._frozen.get(memo_key)
+        except TypeError:  # unhashable values, skip the memo
+            memo_key, frozen = None, None
+        if frozen is None:
+            if id_ in cls._registry:
+                frozen = cls._instance(id_).validate(config)
+            else:
+                frozen = FrozenConfig(id_, dict(config))
+            if memo_key is not None:
+                if len(cls._frozen) >= cls._frozen_limit:
+                    cls._frozen.clear()
+                cls._frozen[memo_key] = frozen
+        return frozen
+
+    @classmethod
+    def generate(cls, id_: str, config: Mapping[str, Any] = None):
+        config = cls.freeze(id_, config)
+        result = cls._cache.get(config.key)
+        if result is not None:
+            return result
+        result = cls._instance(id_).generate(config)
+        if isinstance(result, PixelBuffer):
+            result = result.to_texture()
+        cls._cache[config.key] = result
+        return result
+
+    # ------------------------------------------------------------------
+    # Cache access
+    # ------------------------------------------------------------------
+    @classmethod
+    def get_cached(cls, key: str):
+        return cls._cache.get(key)
+
+    @classmethod
+    def set_cached(cls, key: str, value: object):
+        cls._cache[key] = value
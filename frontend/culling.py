@@ -0,0 +1,264 @@
+# ==========================================
+# frontend/culling.py
+# ==========================================
+"""
+CPU-side frustum and distance culling for assembled neighbourhoods.
+
+Each NeighbourhoodInstance carries a bounding sphere for itself and one per
+child entity (see NeighbourhoodAssembler.build). Every frame the culler tests
+the neighbourhood spheres against the camera frustum and a maximum draw
+distance; only neighbourhoods that straddle the frustum descend into their
+children. Entities are shown/hidden only when their visibility changes; they
+stay enabled, so colliders and update() keep running while off-screen.
+
+Spheres are in world space. After moving an instance's root, call
+NeighbourhoodInstance.move() (or culler.retrack()) so they are recomputed.
+
+The culler drives itself through a small hook entity, so tracked
+neighbourhoods are tested every frame without extra wiring in main.py.
+Engine imports are deferred so the geometry here can be used headless.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Set, Tuple
+import math
+
+
+# sphere-vs-frustum results
+OUTSIDE, INTERSECT, INSIDE = 0, 1, 2
+
+
+@dataclass(frozen=True)
+class BoundingSphere:
+    center: Tuple[float, float, float]
+    radius: float
+
+    @classmethod
+    def enclosing(cls, spheres: Iterable["BoundingSphere"]) -> Optional["BoundingSphere"]:
+        """Loose sphere around a set of spheres (AABB centre, max reach)."""
+        spheres = list(spheres)
+        if not spheres:
+            return None
+        lo = [min(s.center[i] - s.radius for s in spheres) for i in range(3)]
+        hi = [max(s.center[i] + s.radius for s in spheres) for i in range(3)]
+        c = tuple((lo[i] + hi[i]) * 0.5 for i in range(3))
+        r = max(math.dist(c, s.center) + s.radius for s in spheres)
+        return cls(c, r)
+
+
+def entity_bounds(entity) -> BoundingSphere:
+    """World-space bounding sphere of an Ursina entity."""
+    from ursina import scene
+    b = entity.get_tight_bounds(scene) if entity.model else None
+    if b:
+        lo, hi = b
+        c = ((lo[0] + hi[0]) * 0.5, (lo[1] + hi[1]) * 0.5, (lo[2] + hi[2]) * 0.5)
+        return BoundingSphere(c, math.dist(c, tuple(hi)))
+    # no geometry loaded yet: fall back to a unit cube scaled like the entity
+    p, s = entity.world_position, entity.world_scale
+    return BoundingSphere((p.x, p.y, p.z), 0.5 * math.sqrt(s.x*s.x + s.y*s.y + s.z*s.z))
+
+
+class _Frustum:
+    """
+    Camera frustum in a form cheap to test spheres against.
+
+    Perspective frustums take the lens' full horizontal/vertical FOV in
+    degrees; orthographic ones take the film size (width, height) instead.
+    """
+
+    def __init__(self, pos, fwd, right, up, near: float, far: float,
+                 fov: Tuple[float, float] = None, film_size: Tuple[float, float] = None):
+        self.pos = tuple(pos)
+        self.fwd = tuple(fwd)
+        self.right = tuple(right)
+        self.up = tuple(up)
+        self.near = near
+        self.far = far
+        self.ortho = film_size is not None
+        if self.ortho:
+            self.half_w, self.half_h = film_size[0] * 0.5, film_size[1] * 0.5
+        else:
+            half_h, half_v = math.radians(fov[0]) * 0.5, math.radians(fov[1]) * 0.5
+            self.sin_h, self.cos_h = math.sin(half_h), math.cos(half_h)
+            self.sin_v, self.cos_v = math.sin(half_v), math.cos(half_v)
+
+    @classmethod
+    def from_camera(cls, cam, max_distance: float) -> "_Frustum":
+        """Build from the lens the engine actually renders with."""
+        from panda3d.core import OrthographicLens
+        lens = cam.lens
+        p = cam.world_position
+        far = min(max_distance, lens.get_far())
+        if isinstance(lens, OrthographicLens):
+            film = lens.get_film_size()
+            return cls((p.x, p.y, p.z), cam.forward, cam.right, cam.up,
+                       lens.get_near(), far, film_size=(film[0], film[1]))
+        return cls((p.x, p.y, p.z), cam.forward, cam.right, cam.up,
+                   lens.get_near(), far, fov=(lens.get_hfov(), lens.get_vfov()))
+
+    def classify(self, s: BoundingSphere) -> int:
+        dx = s.center[0] - self.pos[0]
+        dy = s.center[1] - self.pos[1]
+        dz = s.center[2] - self.pos[2]
+        r = s.radius
+
+        # distance culling
+        if dx*dx + dy*dy + dz*dz > (self.far + r) ** 2:
+            return OUTSIDE
+
+        # camera-space coordinates
+        z = dx*self.fwd[0] + dy*self.fwd[1] + dz*self.fwd[2]
+        if z < self.near - r:
+            return OUTSIDE
+        x = dx*self.right[0] + dy*self.right[1] + dz*self.right[2]
+        y = dx*self.up[0] + dy*self.up[1] + dz*self.up[2]
+
+        # signed distances to the four side planes (positive = outside)
+        if self.ortho:
+            dh = abs(x) - self.half_w
+            dv = abs(y) - self.half_h
+        else:
+            dh = abs(x) * self.cos_h - z * self.sin_h
+            dv = abs(y) * self.cos_v - z * self.sin_v
+        if dh > r or dv > r:
+            return OUTSIDE
+
+        if (dh < -r and dv < -r and z > self.near + r
+                and math.sqrt(dx*dx + dy*dy + dz*dz) + r < self.far):
+            return INSIDE
+        return INTERSECT
+
+
+class NeighbourhoodCuller:
+    """Toggles neighbourhood and child entity visibility once per frame.
+
+    Neighbourhoods are bucketed in a coarse XZ grid so a frame only looks at
+    cells within draw distance plus whatever was visible last frame.
+    """
+
+    def __init__(self, cam=None, max_distance: float = 120.0, cell_size: float = 64.0,
+                 auto_update: bool = True):
+        if cam is None:
+            from ursina import camera as cam
+        self.camera = cam
+        self.max_distance = max_distance
+        self.cell_size = cell_size
+        self.instances: Dict[str, object] = {}
+        self._grid: Dict[Tuple[int, int], Set[str]] = {}
+        self._shown: Set[str] = set()
+        # last applied visibility per entity, so we only touch changed ones
+        self._visible: Dict[int, bool] = {}
+        self._hook = _make_hook(self) if auto_update else None
+
+    def destroy(self):
+        """Stop per-frame culling and leave every tracked entity visible."""
+        for inst in list(self.instances.values()):
+            self.untrack(inst)
+        if self._hook:
+            from ursina import destroy
+            destroy(self._hook)
+            self._hook = None
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+    def _cells(self, x: float, z: float, r: float):
+        cs = self.cell_size
+        for cx in range(math.floor((x - r) / cs), math.floor((x + r) / cs) + 1):
+            for cz in range(math.floor((z - r) / cs), math.floor((z + r) / cs) + 1):
+                yield cx, cz
+
+    def _bucket(self, instance):
+        (x, _, z), r = instance.bounds.center, instance.bounds.radius
+        for cell in self._cells(x, z, r):
+            self._grid.setdefault(cell, set()).add(instance.cache_key)
+
+    def _unbucket(self, instance):
+        (x, _, z), r = instance.bounds.center, instance.bounds.radius
+        for cell in self._cells(x, z, r):
+            keys = self._grid.get(cell)
+            if keys:
+                keys.discard(instance.cache_key)
+                if not keys:
+                    del self._grid[cell]
+
+    def track(self, instance):
+        if instance.bounds is None or instance.cache_key in self.instances:
+            return
+        self.instances[instance.cache_key] = instance
+        self._bucket(instance)
+        # the next update() hides it if it is out of view
+        self._shown.add(instance.cache_key)
+
+    def retrack(self, instance):
+        """Recompute bounds and grid cells after the instance's root moved."""
+        if instance.cache_key not in self.instances:
+            instance.compute_bounds()
+            self.track(instance)
+            return
+        self._unbucket(instance)
+        instance.compute_bounds()
+        if instance.bounds is None:
+            self.untrack(instance)
+            return
+        self._bucket(instance)
+        # make sure the next update() reconsiders it at its new location
+        self._shown.add(instance.cache_key)
+
+    def untrack(self, instance):
+        if self.instances.pop(instance.cache_key, None) is None:
+            return
+        self._unbucket(instance)
+        self._shown.discard(instance.cache_key)
+        # leave everything visible for whoever owns it next
+        for e in [instance.root, *instance.entities]:
+            if self._visible.pop(id(e), True) is False:
+                e.visible = True
+
+    # ------------------------------------------------------------------
+    # Per-frame pass
+    # ------------------------------------------------------------------
+    def _set(self, entity, visible: bool):
+        key = id(entity)
+        if self._visible.get(key) is visible:
+            return
+        self._visible[key] = visible
+        # visibility only: 'enabled' would also switch off colliders and update()
+        entity.visible = visible
+
+    def update(self):
+        frustum = _Frustum.from_camera(self.camera, self.max_distance)
+        x, _, z = frustum.pos
+
+        candidates = set(self._shown)
+        for cell in self._cells(x, z, self.max_distance):
+            candidates |= self._grid.get(cell, ())
+
+        shown = set()
+        for key in candidates:
+            inst = self.instances[key]
+            result = frustum.classify(inst.bounds)
+            if result == OUTSIDE:
+                # hiding the root hides the whole subtree; children keep
+                # their last state and are only revisited when it returns
+                self._set(inst.root, False)
+                continue
+            shown.add(key)
+            self._set(inst.root, True)
+            self._cull_children(frustum, inst, result == INSIDE)
+        self._shown = shown
+
+    def _cull_children(self, frustum: _Frustum, inst, fully_inside: bool):
+        for e, b in zip(inst.entities, inst.entity_bounds):
+            self._set(e, fully_inside or frustum.classify(b) != OUTSIDE)
+
+
+def _make_hook(culler: NeighbourhoodCuller):
+    """Entity whose update() runs the culler once per frame."""
+    from ursina import Entity
+
+    class _CullerHook(Entity):
+        def update(self):
+            culler.update()
+
+    return _CullerHook(name="NeighbourhoodCuller")
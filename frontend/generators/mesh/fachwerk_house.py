@@ -3,6 +3,7 @@
 # ==========================================
 from ursina import Mesh, Vec3
 from frontend.asset_manager import IAssetGeneratorV2, AssetManager
+from frontend.pixel_buffer import PixelBuffer
 from math import radians, sin, cos
 import random
 from pathlib import Path
@@ -56,19 +57,39 @@ class FachwerkHouseGenerator(IAssetGeneratorV2):
         plaster_cfg = {"size": 512, "tone": rng.choice(["neutral", "warm"])}
         wood_cfg    = {"size": 512, "tint": "dark", "grain_noise": 0.4}
 
+        mesh.texture = self._composite(plaster_cfg, wood_cfg)
+
+        return mesh
+
+    def _composite(self, plaster_cfg, wood_cfg):
+        """
+        Blend plaster and wood into one texture, cached per input pair.
+
+        The inputs live on the GPU once uploaded, so reading them back is a
+        blocking transfer; caching keeps that to once per plaster tone
+        rather than once per house.
+        """
+        plaster_cfg = AssetManager.freeze("texture.plaster_wall", plaster_cfg)
+        wood_cfg = AssetManager.freeze("texture.wood_planks", wood_cfg)
+        key = f"{self.id}:composite:{plaster_cfg.digest}:{wood_cfg.digest}"
+        cached = AssetManager.get_cached(key)
+        if cached is not None:
+            return cached
+
         plaster_tex = AssetManager.generate("texture.plaster_wall", plaster_cfg)
         wood_tex    = AssetManager.generate("texture.wood_planks", wood_cfg)
 
         # merge both into a composite texture for demonstration
         # (in production you'd assign different materials per submesh)
-        img_wall = plaster_tex.image
-        img_wood = wood_tex.image.resize(img_wall.size)
+        img_wall = PixelBuffer.from_texture(plaster_tex).to_image()
+        img_wood = PixelBuffer.from_texture(wood_tex).to_image()
+        if img_wood.size != img_wall.size:
+            img_wood = img_wood.resize(img_wall.size)
         blend = Image.blend(img_wall, img_wood, 0.25)
 
-        from ursina import Texture
-        mesh.texture = Texture(blend)
-
-        return mesh
+        tex = PixelBuffer.from_image(blend).to_texture()
+        AssetManager.set_cached(key, tex)
+        return tex
 
 
 AssetManager.register_generator(FachwerkHouseGenerator)
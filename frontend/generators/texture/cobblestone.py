@@ -1,6 +1,6 @@
-from ursina import Texture
 from PIL import Image, ImageDraw, ImageFilter
 from frontend.asset_manager import IAssetGeneratorV2, AssetManager
+from frontend.pixel_buffer import PixelBuffer
 
 
 class CobblestoneGenerator(IAssetGeneratorV2):
@@ -43,7 +43,7 @@ class CobblestoneGenerator(IAssetGeneratorV2):
             img = img.point(lambda v: int(v * 0.8))
 
         img = img.filter(ImageFilter.GaussianBlur(0.8))
-        return Texture(img)
+        return PixelBuffer.from_image(img)
 
 
 AssetManager.register_generator(CobblestoneGenerator)
@@ -1,6 +1,6 @@
-from ursina import Texture
 from PIL import Image, ImageDraw, ImageFilter
 from frontend.asset_manager import IAssetGeneratorV2, AssetManager
+from frontend.pixel_buffer import PixelBuffer
 
 
 class PlasterWallGenerator(IAssetGeneratorV2):
@@ -37,7 +37,7 @@ class PlasterWallGenerator(IAssetGeneratorV2):
             draw.ellipse([x - r, y - r, x + r, y + r], fill=(c, c, c))
 
         img = img.filter(ImageFilter.GaussianBlur(1.2))
-        return Texture(img)
+        return PixelBuffer.from_image(img)
 
 
 AssetManager.register_generator(PlasterWallGenerator)
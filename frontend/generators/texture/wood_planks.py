@@ -1,6 +1,6 @@
-from ursina import Texture
 from PIL import Image, ImageDraw, ImageFilter
 from frontend.asset_manager import IAssetGeneratorV2, AssetManager
+from frontend.pixel_buffer import PixelBuffer
 
 
 class WoodPlankGenerator(IAssetGeneratorV2):
@@ -42,7 +42,7 @@ class WoodPlankGenerator(IAssetGeneratorV2):
             draw.line([x0, 0, x0, size], fill=(40, 25, 15), width=2)
 
         img = img.filter(ImageFilter.GaussianBlur(0.6))
-        return Texture(img)
+        return PixelBuffer.from_image(img)
 
 
 AssetManager.register_generator(WoodPlankGenerator)
@@ -3,19 +3,48 @@
 # ==========================================
 from ursina import Entity, color
 from frontend.asset_manager import AssetManager
-from hashlib import md5
-import json
+from frontend.culling import BoundingSphere, entity_bounds
 
 
 class NeighbourhoodInstance:
     """Container for a fully built neighbourhood."""
-    def __init__(self, root: Entity, entities: list, cache_key: str):
+    def __init__(self, root: Entity, entities: list, cache_key: str, culler=None):
         self.root = root
         self.entities = entities
         self.cache_key = cache_key
+        self.culler = culler
+        self.compute_bounds()
+
+    def _root_transform(self):
+        r = self.root
+        return (tuple(r.world_position), tuple(r.world_rotation), tuple(r.world_scale))
+
+    def compute_bounds(self):
+        """(Re)compute world-space bounding spheres used by NeighbourhoodCuller."""
+        self.entity_bounds = [entity_bounds(e) for e in self.entities]
+        self.bounds = BoundingSphere.enclosing(self.entity_bounds)
+        self._bounds_transform = self._root_transform()
+
+    def sync_bounds(self):
+        """Recompute bounds only if the root moved since they were computed."""
+        if self._root_transform() != self._bounds_transform:
+            self.move()
+
+    def move(self, position=None, rotation=None):
+        """Place the neighbourhood root and keep culling bounds in sync."""
+        if position is not None:
+            self.root.position = position
+        if rotation is not None:
+            self.root.rotation = rotation
+        if self.culler:
+            self.culler.retrack(self)
+        else:
+            self.compute_bounds()
 
     def unload(self):
         """Destroy all Ursina entities belonging to this neighbourhood."""
+        if self.culler:
+            self.culler.untrack(self)
         for e in self.entities:
             if hasattr(e, "disable"):
                 e.disable()
@@ -32,16 +61,24 @@ class NeighbourhoodAssembler:
     """Builds or reuses cached neighbourhood entity trees."""
 
     @staticmethod
-    def _make_cache_key(neighbourhood_id: str, cfg: dict) -> str:
-        key_data = json.dumps(cfg, sort_keys=True)
-        return f"{neighbourhood_id}:{md5(key_data.encode()).hexdigest()}"
+    def _make_cache_key(neighbourhood_id: str, cfg) -> str:
+        # reuse the generator's frozen config digest (memoised by freeze); the
+        # prefix keeps assemblies apart from the blueprint cached under cfg.key
+        return f"assembly:{AssetManager.freeze(neighbourhood_id, cfg).key}"
 
     @classmethod
-    def build(cls, blueprint: dict, neighbourhood_id: str, cfg: dict):
+    def build(cls, blueprint: dict, neighbourhood_id: str, cfg: dict, culler=None):
         cache_key = cls._make_cache_key(neighbourhood_id, cfg)
         cached = AssetManager.get_cached(cache_key)
         if cached:
             print(f"[NeighbourhoodAssembler] Using cached assembly for {neighbourhood_id}")
+            if culler and culler is not cached.culler:
+                if cached.culler:
+                    cached.culler.untrack(cached)
+                cached.culler = culler
+                culler.track(cached)
+            # cheap transform compare; bounds are only rebuilt if the root moved
+            cached.sync_bounds()
             return cached
 
         print(f"[NeighbourhoodAssembler] Assembling new neighbourhood {neighbourhood_id}")
@@ -106,7 +143,9 @@ class NeighbourhoodAssembler:
             )
             entities.append(ent)
 
-        instance = NeighbourhoodInstance(root, entities, cache_key)
+        instance = NeighbourhoodInstance(root, entities, cache_key, culler)
+        if culler:
+            culler.track(instance)
         AssetManager.set_cached(cache_key, instance)
         print(f"[NeighbourhoodAssembler] Cached {neighbourhood_id}")
         return instance
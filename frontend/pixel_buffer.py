@@ -0,0 +1,102 @@
+# ==========================================
+# frontend/pixel_buffer.py
+# ==========================================
+"""
+PixelBuffer – raw texture pixels handed straight to the engine.
+
+Rows are stored bottom-up in BGR/BGRA byte order, which is Panda3D's native
+RAM image layout, so a buffer can be uploaded with set_ram_image() without
+any flip or channel swizzle. Generators may return a PixelBuffer instead of
+a Texture; AssetManager uploads it and drops the CPU copy once the GPU has
+it. Consumers that need pixels back (e.g. for compositing) use
+PixelBuffer.from_texture(), which reads the RAM image if it is still around
+and extracts it from the GPU otherwise.
+"""
+from PIL import Image
+
+
+# PIL mode -> (Panda3D raw order, bytes per pixel)
+_MODES = {
+    "RGB":  ("BGR", 3),
+    "RGBA": ("BGRA", 4),
+}
+
+
+class PixelBuffer:
+    """Contiguous bottom-up BGR(A) pixel rows plus size and mode."""
+    __slots__ = ("width", "height", "mode", "data")
+
+    def __init__(self, width: int, height: int, mode: str, data):
+        if mode not in _MODES:
+            raise ValueError(f"Unsupported pixel mode '{mode}'")
+        view = memoryview(data)
+        expected = width * height * _MODES[mode][1]
+        if view.nbytes != expected:
+            raise ValueError(f"Pixel buffer has {view.nbytes} bytes, expected {expected}")
+        self.width = width
+        self.height = height
+        self.mode = mode
+        self.data = view
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    # ------------------------------------------------------------------
+    # PIL interop
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_image(cls, img: Image.Image) -> "PixelBuffer":
+        """Pack a PIL image in one pass (flip and swizzle done by the encoder)."""
+        if img.mode not in _MODES:
+            img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+        raw = _MODES[img.mode][0]
+        return cls(img.width, img.height, img.mode, img.tobytes("raw", raw, 0, -1))
+
+    def to_image(self) -> Image.Image:
+        raw = _MODES[self.mode][0]
+        return Image.frombuffer(self.mode, self.size, self.data, "raw", raw, 0, -1)
+
+    # ------------------------------------------------------------------
+    # Engine texture interop
+    # ------------------------------------------------------------------
+    def to_texture(self, keep_ram: bool = False):
+        """
+        Upload into a new engine texture.
+
+        With keep_ram=False Panda3D frees its RAM copy once the texture has
+        been prepared on the GPU; from_texture() reads it back on demand.
+        """
+        from ursina import Texture
+        from panda3d.core import Texture as PandaTexture
+        fmt = PandaTexture.F_rgba if self.mode == "RGBA" else PandaTexture.F_rgb
+        ptex = PandaTexture()
+        ptex.setup_2d_texture(self.width, self.height, PandaTexture.T_unsigned_byte, fmt)
+        ptex.set_ram_image(self.data)
+        ptex.set_keep_ram_image(keep_ram)
+        return Texture(ptex)
+
+    @classmethod
+    def from_texture(cls, texture) -> "PixelBuffer":
+        """Read pixels back from an engine texture (RAM image or GPU)."""
+        ptex = getattr(texture, "_texture", texture)
+        extracted = False
+        if not ptex.has_ram_image():
+            from ursina import application
+            base = application.base
+            if not base.graphicsEngine.extract_texture_data(ptex, base.win.get_gsg()):
+                raise RuntimeError(f"Could not read back texture '{ptex.get_name()}'")
+            extracted = True
+
+        mode = "RGBA" if ptex.get_num_components() == 4 else "RGB"
+        if ptex.get_component_width() != 1 or ptex.get_num_components() not in (3, 4):
+            # unusual formats go through Panda's converter (one copy)
+            data = ptex.get_ram_image_as(_MODES[mode][0])
+        else:
+            data = ptex.get_ram_image()
+        buf = cls(ptex.get_x_size(), ptex.get_y_size(), mode, data)
+
+        if extracted and not ptex.get_keep_ram_image():
+            # the buffer keeps its own reference to the pixel array
+            ptex.clear_ram_image()
+        return buf
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import random
+
+import pytest
+
+from frontend.asset_manager import (
+    AssetManager, FrozenConfig, IAssetGeneratorV2, compile_parameters,
+)
+
+
+class DummyGenerator(IAssetGeneratorV2):
+    id = "test.dummy"
+    category = "test"
+    description = "Returns its config and one RNG draw."
+    parameters = {
+        "size":  {"type": "int", "default": 512, "min": 128, "max": 2048},
+        "rough": {"type": "float", "default": 0.25, "min": 0.0, "max": 1.0},
+        "tone":  {"type": "enum", "default": "neutral", "values": ["neutral", "warm"]},
+        "flag":  {"type": "bool", "default": True},
+        "extra": {"default": None},
+    }
+
+    def generate(self, cfg):
+        cfg = self.validate(cfg)
+        return cfg, self.rng(cfg).random()
+
+
+@pytest.fixture(autouse=True)
+def clean_manager(monkeypatch):
+    for attr in ("_registry", "_cache", "_instances", "_frozen"):
+        monkeypatch.setattr(AssetManager, attr, {})
+    AssetManager.register_generator(DummyGenerator)
+
+
+def test_compiled_validator_clamps_and_defaults():
+    validate = compile_parameters(DummyGenerator.parameters)
+    fixed = validate({"size": "99999", "rough": -1, "tone": "cold", "flag": 0})
+    assert fixed == {"size": 2048, "rough": 0.0, "tone": "neutral", "flag": False, "extra": None}
+
+
+def test_frozen_config_digest_matches_sorted_json():
+    values = {"b": [1, {"c": 2}], "a": 1}
+    cfg = FrozenConfig("g", values)
+    assert cfg.digest == hashlib.sha256(json.dumps(values, sort_keys=True).encode()).hexdigest()
+    assert cfg.key == f"g:{cfg.digest}"
+    assert cfg == FrozenConfig("g", {"a": 1, "b": [1, {"c": 2}]})
+    assert hash(cfg) == hash(FrozenConfig("g", cfg.to_dict()))
+    assert cfg != FrozenConfig("other", values)
+
+
+def test_frozen_config_is_deep_frozen_and_thaws():
+    cfg = FrozenConfig("g", {"l": [1, {"a": [2]}]})
+    assert cfg["l"] == (1, cfg["l"][1])
+    with pytest.raises(TypeError):
+        cfg["l"][1]["a"] = 3
+    thawed = cfg.to_dict()
+    assert thawed == {"l": [1, {"a": [2]}]}
+    thawed["l"].append(5)
+    assert cfg["l"] == (1, cfg["l"][1])
+
+
+def test_rng_seed_from_digest_matches_plain_dict():
+    gen = DummyGenerator()
+    cfg = gen.validate({})
+    assert gen.rng(cfg).random() == gen.rng(cfg.to_dict()).random()
+
+
+def test_freeze_memoises_equal_configs():
+    a = AssetManager.freeze("test.dummy", {"size": 256})
+    assert AssetManager.freeze("test.dummy", {"size": 256}) is a
+    assert AssetManager.freeze("test.dummy", a) is a
+
+
+@pytest.mark.parametrize("first, second", [
+    ({"extra": 1}, {"extra": True}),
+    ({"extra": (1, 2)}, {"extra": (1.0, 2.0)}),
+    ({"extra": {"k": [1]}}, {"extra": {"k": [True]}}),
+])
+def test_freeze_memo_is_type_sensitive(first, second):
+    validate = compile_parameters(DummyGenerator.parameters)
+    a = AssetManager.freeze("test.dummy", first)
+    b = AssetManager.freeze("test.dummy", second)
+    assert a is not b
+    assert a.digest == FrozenConfig("test.dummy", validate(first)).digest
+    assert b.digest == FrozenConfig("test.dummy", validate(second)).digest
+
+
+def test_freeze_unregistered_id_is_memoised_unvalidated():
+    a = AssetManager.freeze("not.registered", {"x": 1})
+    assert dict(a) == {"x": 1}
+    assert AssetManager.freeze("not.registered", {"x": 1}) is a
+    assert AssetManager.freeze("not.registered", None).key.startswith("not.registered:")
+
+
+def test_generate_caches_by_frozen_key():
+    first = AssetManager.generate("test.dummy", {"size": 300})
+    assert AssetManager.generate("test.dummy", {"size": 300}) is first
+    assert AssetManager.get_cached(first[0].key) is first
+    with pytest.raises(KeyError):
+        AssetManager.generate("not.registered")
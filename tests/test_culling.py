@@ -0,0 +1,48 @@
+import math
+
+from frontend.culling import BoundingSphere, _Frustum, OUTSIDE, INTERSECT, INSIDE
+
+
+def looking_down_z(far=100.0, **lens):
+    """Camera at the origin looking along +Z."""
+    if not lens:
+        lens = {"fov": (90.0, 60.0)}
+    return _Frustum((0, 0, 0), (0, 0, 1), (1, 0, 0), (0, 1, 0), 0.1, far, **lens)
+
+
+def test_enclosing_contains_all_spheres():
+    spheres = [BoundingSphere((0, 0, 0), 1.0), BoundingSphere((10, 0, 0), 2.0),
+               BoundingSphere((3, 4, -5), 0.5)]
+    outer = BoundingSphere.enclosing(spheres)
+    for s in spheres:
+        assert math.dist(outer.center, s.center) + s.radius <= outer.radius + 1e-9
+
+
+def test_enclosing_empty_is_none():
+    assert BoundingSphere.enclosing([]) is None
+
+
+def test_classify_perspective():
+    f = looking_down_z()
+    assert f.classify(BoundingSphere((0, 0, 20), 1.0)) == INSIDE
+    assert f.classify(BoundingSphere((0, 0, -20), 1.0)) == OUTSIDE
+    # hfov 90: the right plane is x == z
+    assert f.classify(BoundingSphere((25, 0, 20), 1.0)) == OUTSIDE
+    assert f.classify(BoundingSphere((20, 0, 20), 1.0)) == INTERSECT
+    assert f.classify(BoundingSphere((17, 0, 20), 1.0)) == INSIDE
+    # vfov 60 is narrower than hfov: same offset on y is outside
+    assert f.classify(BoundingSphere((0, 19, 20), 1.0)) == OUTSIDE
+
+
+def test_classify_max_distance():
+    f = looking_down_z(far=50.0)
+    assert f.classify(BoundingSphere((0, 0, 52), 1.0)) == OUTSIDE
+    assert f.classify(BoundingSphere((0, 0, 50.5), 1.0)) == INTERSECT
+
+
+def test_classify_orthographic():
+    f = looking_down_z(film_size=(20.0, 10.0))
+    assert f.classify(BoundingSphere((9, 4, 30), 0.5)) == INSIDE
+    assert f.classify(BoundingSphere((10, 0, 30), 0.5)) == INTERSECT
+    assert f.classify(BoundingSphere((0, 6, 30), 0.5)) == OUTSIDE
+    assert f.classify(BoundingSphere((0, 0, -1), 0.5)) == OUTSIDE
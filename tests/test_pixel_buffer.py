@@ -0,0 +1,36 @@
+import pytest
+from PIL import Image
+
+from frontend.pixel_buffer import PixelBuffer
+
+
+@pytest.mark.parametrize("mode", ["RGB", "RGBA"])
+def test_image_round_trip(mode):
+    img = Image.new(mode, (4, 3))
+    for i, xy in enumerate([(0, 0), (3, 0), (0, 2), (3, 2)]):
+        img.putpixel(xy, tuple(10 * (i + 1) + c for c in range(len(mode))))
+    buf = PixelBuffer.from_image(img)
+    assert buf.size == (4, 3)
+    assert buf.data.nbytes == 4 * 3 * len(mode)
+    assert buf.to_image().tobytes() == img.tobytes()
+
+
+def test_layout_is_bottom_up_bgr():
+    img = Image.new("RGB", (2, 2))
+    img.putpixel((0, 0), (1, 2, 3))     # top-left
+    buf = PixelBuffer.from_image(img)
+    # top-left lands at the start of the last row, channels swapped
+    assert bytes(buf.data[6:9]) == b"\x03\x02\x01"
+
+
+def test_other_modes_are_converted():
+    buf = PixelBuffer.from_image(Image.new("L", (2, 2), 7))
+    assert buf.mode == "RGB"
+    assert bytes(buf.data) == b"\x07" * 12
+
+
+def test_size_mismatch_rejected():
+    with pytest.raises(ValueError):
+        PixelBuffer(2, 2, "RGB", b"\x00" * 11)
+    with pytest.raises(ValueError):
+        PixelBuffer(1, 1, "CMYK", b"\x00" * 4)